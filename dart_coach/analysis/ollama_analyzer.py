@@ -10,6 +10,7 @@ import os
 from typing import Any, Dict, List, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from .prompts import AnalysisPrompts
 
@@ -27,6 +28,7 @@ class OllamaAnalyzer:
         model: str = "llama3.1:8b",
         temperature: float = 0.7,
         max_tokens: int = 4096,
+        max_concurrent_requests: int = 1,
         log_level: str = "INFO"
     ):
         """
@@ -37,12 +39,19 @@ class OllamaAnalyzer:
             model: Model to use for analysis
             temperature: Generation temperature
             max_tokens: Maximum tokens in response
+            max_concurrent_requests: Analysis requests to send at once; keep
+                at or below the server's OLLAMA_NUM_PARALLEL, since queued
+                requests count against the same timeout
             log_level: Logging level
         """
         self.base_url = base_url or os.getenv('OLLAMA_HOST', 'http://localhost:11434')
         self.model = model
         self.temperature = temperature
         self.max_tokens = max_tokens
+        self.max_concurrent_requests = max(1, int(max_concurrent_requests))
+        
+        # Reuse connections to the Ollama server across analysis calls
+        self.session = self._create_session()
         
         # Setup logging
         self.logger = logging.getLogger(self.__class__.__name__)
@@ -55,6 +64,24 @@ class OllamaAnalyzer:
             ))
             self.logger.addHandler(handler)
     
+    def _create_session(self) -> requests.Session:
+        """Create a requests session with a keep-alive connection pool."""
+        session = requests.Session()
+        
+        # One pooled connection per request allowed in flight
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=max(1, self.max_concurrent_requests)
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        
+        return session
+    
+    def close(self):
+        """Close pooled connections to the Ollama server."""
+        self.session.close()
+    
     def _call_ollama(
         self,
         prompt: str,
@@ -87,7 +114,7 @@ class OllamaAnalyzer:
         
         try:
             self.logger.debug(f"Calling Ollama at {url}")
-            response = requests.post(url, json=payload, timeout=300)
+            response = self.session.post(url, json=payload, timeout=300)
             response.raise_for_status()
             
             result = response.json()
@@ -109,7 +136,7 @@ class OllamaAnalyzer:
     def check_connection(self) -> bool:
         """Check if Ollama is available."""
         try:
-            response = requests.get(f"{self.base_url}/api/tags", timeout=5)
+            response = self.session.get(f"{self.base_url}/api/tags", timeout=5)
             return response.status_code == 200
         except Exception:
             return False
@@ -117,7 +144,7 @@ class OllamaAnalyzer:
     def list_models(self) -> List[str]:
         """List available Ollama models."""
         try:
-            response = requests.get(f"{self.base_url}/api/tags", timeout=10)
+            response = self.session.get(f"{self.base_url}/api/tags", timeout=10)
             response.raise_for_status()
             data = response.json()
             return [m['name'] for m in data.get('models', [])]
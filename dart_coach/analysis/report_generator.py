@@ -6,6 +6,7 @@ Generates comprehensive weekly analysis reports.
 
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, Optional
@@ -314,22 +315,41 @@ class ReportGenerator:
         previous_week: Optional[Dict[str, Any]]
     ) -> Dict[str, Any]:
         """Generate AI-powered analysis sections."""
-        # Get main analysis
-        weekly_analysis = self.analyzer.analyze_weekly_performance(aggregated_data)
-        
-        # Get specific analyses
-        trend_analysis = self.analyzer.analyze_trends(aggregated_data, previous_week)
-        
         bio_data = aggregated_data.get('biomechanics_data', {})
-        bio_analysis = ""
-        if bio_data.get('sessions', 0) > 0:
-            bio_analysis = self.analyzer.analyze_biomechanics(bio_data)
-        
-        mental_analysis = self.analyzer.analyze_mental_game(aggregated_data)
         
-        # Get recommendations
-        drill_recommendations = self.analyzer.recommend_drills(aggregated_data)
-        goal_recommendations = self.analyzer.set_goals(aggregated_data, previous_week)
+        # The analyses are independent Ollama requests. Only overlap as many
+        # as the server runs in parallel: a request queued behind others
+        # spends its timeout waiting and comes back empty.
+        with ThreadPoolExecutor(
+            max_workers=self.analyzer.max_concurrent_requests
+        ) as executor:
+            weekly_future = executor.submit(
+                self.analyzer.analyze_weekly_performance, aggregated_data
+            )
+            trend_future = executor.submit(
+                self.analyzer.analyze_trends, aggregated_data, previous_week
+            )
+            bio_future = None
+            if bio_data.get('sessions', 0) > 0:
+                bio_future = executor.submit(
+                    self.analyzer.analyze_biomechanics, bio_data
+                )
+            mental_future = executor.submit(
+                self.analyzer.analyze_mental_game, aggregated_data
+            )
+            drill_future = executor.submit(
+                self.analyzer.recommend_drills, aggregated_data
+            )
+            goal_future = executor.submit(
+                self.analyzer.set_goals, aggregated_data, previous_week
+            )
+            
+            weekly_analysis = weekly_future.result()
+            trend_analysis = trend_future.result()
+            bio_analysis = bio_future.result() if bio_future else ""
+            mental_analysis = mental_future.result()
+            drill_recommendations = drill_future.result()
+            goal_recommendations = goal_future.result()
         
         # Parse into structured format
         return {
@@ -69,6 +69,18 @@ class PoseProcessor:
     # Throw phases based on arm position
     THROW_PHASES = ['setup', 'backswing', 'acceleration', 'release', 'follow_through']
     
+    # Skeleton segments drawn between landmarks
+    SKELETON_CONNECTIONS = (
+        ('left_shoulder', 'right_shoulder'),
+        ('left_shoulder', 'left_elbow'),
+        ('left_elbow', 'left_wrist'),
+        ('right_shoulder', 'right_elbow'),
+        ('right_elbow', 'right_wrist'),
+        ('left_shoulder', 'left_hip'),
+        ('right_shoulder', 'right_hip'),
+        ('left_hip', 'right_hip'),
+    )
+    
     def __init__(
         self,
         model_complexity: int = 2,
@@ -95,6 +107,12 @@ class PoseProcessor:
         self.enable_segmentation = enable_segmentation
         self.throwing_hand = throwing_hand
         
+        # Throwing-side landmark names, resolved once instead of per frame
+        self._arm_landmark_names = tuple(
+            f'{throwing_hand}_{joint}'
+            for joint in ('shoulder', 'elbow', 'wrist', 'hip')
+        )
+        
         # Initialize MediaPipe
         self.mp_pose = mp.solutions.pose
         self.mp_drawing = mp.solutions.drawing_utils
@@ -184,8 +202,11 @@ class PoseProcessor:
         """Extract relevant landmarks from MediaPipe results."""
         landmarks = {}
         
+        # Resolve the repeated landmark field once rather than per index
+        pose_landmark_list = pose_landmarks.landmark
+        
         for idx, name in self.LANDMARK_NAMES.items():
-            lm = pose_landmarks.landmark[idx]
+            lm = pose_landmark_list[idx]
             landmarks[name] = Landmark(
                 x=lm.x,
                 y=lm.y,
@@ -200,11 +221,9 @@ class PoseProcessor:
         angles = {}
         
         # Determine which side to analyze
-        prefix = self.throwing_hand
-        shoulder = landmarks.get(f'{prefix}_shoulder')
-        elbow = landmarks.get(f'{prefix}_elbow')
-        wrist = landmarks.get(f'{prefix}_wrist')
-        hip = landmarks.get(f'{prefix}_hip')
+        shoulder, elbow, wrist, hip = (
+            landmarks.get(name) for name in self._arm_landmark_names
+        )
         
         if all([shoulder, elbow, wrist]):
             # Elbow angle (shoulder-elbow-wrist)
@@ -276,20 +295,21 @@ class PoseProcessor:
         Returns angle in degrees.
         """
         # Create vectors
-        v1 = np.array([
-            point1[0] - point2[0],
-            point1[1] - point2[1],
-            point1[2] - point2[2]
-        ])
-        v2 = np.array([
-            point3[0] - point2[0],
-            point3[1] - point2[1],
-            point3[2] - point2[2]
-        ])
-        
-        # Calculate angle using dot product
-        cos_angle = np.dot(v1, v2) / (np.linalg.norm(v1) * np.linalg.norm(v2) + 1e-6)
-        cos_angle = np.clip(cos_angle, -1.0, 1.0)
+        v1x = point1[0] - point2[0]
+        v1y = point1[1] - point2[1]
+        v1z = point1[2] - point2[2]
+        v2x = point3[0] - point2[0]
+        v2y = point3[1] - point2[1]
+        v2z = point3[2] - point2[2]
+        
+        # Calculate angle using dot product (scalar math avoids per-frame
+        # array allocation for three-element vectors)
+        dot = v1x * v2x + v1y * v2y + v1z * v2z
+        norms = (
+            math.sqrt(v1x * v1x + v1y * v1y + v1z * v1z)
+            * math.sqrt(v2x * v2x + v2y * v2y + v2z * v2z)
+        )
+        cos_angle = max(-1.0, min(1.0, dot / (norms + 1e-6)))
         
         return math.degrees(math.acos(cos_angle))
     
@@ -401,11 +421,12 @@ class PoseProcessor:
         annotated = frame.copy()
         h, w = annotated.shape[:2]
         
-        # Draw landmarks
+        # Draw landmarks, keeping pixel positions of visible ones for the skeleton
+        points = {}
         for name, landmark in pose_frame.landmarks.items():
             if landmark.visibility > 0.5:
-                x = int(landmark.x * w)
-                y = int(landmark.y * h)
+                point = (int(landmark.x * w), int(landmark.y * h))
+                points[name] = point
                 
                 # Color based on throwing arm
                 if self.throwing_hand in name:
@@ -413,29 +434,12 @@ class PoseProcessor:
                 else:
                     color = (255, 255, 255)  # White for other
                 
-                cv2.circle(annotated, (x, y), 5, color, -1)
+                cv2.circle(annotated, point, 5, color, -1)
         
         # Draw connections
-        connections = [
-            ('left_shoulder', 'right_shoulder'),
-            ('left_shoulder', 'left_elbow'),
-            ('left_elbow', 'left_wrist'),
-            ('right_shoulder', 'right_elbow'),
-            ('right_elbow', 'right_wrist'),
-            ('left_shoulder', 'left_hip'),
-            ('right_shoulder', 'right_hip'),
-            ('left_hip', 'right_hip'),
-        ]
-        
-        for start, end in connections:
-            if start in pose_frame.landmarks and end in pose_frame.landmarks:
-                lm1 = pose_frame.landmarks[start]
-                lm2 = pose_frame.landmarks[end]
-                
-                if lm1.visibility > 0.5 and lm2.visibility > 0.5:
-                    p1 = (int(lm1.x * w), int(lm1.y * h))
-                    p2 = (int(lm2.x * w), int(lm2.y * h))
-                    cv2.line(annotated, p1, p2, (200, 200, 200), 2)
+        for start, end in self.SKELETON_CONNECTIONS:
+            if start in points and end in points:
+                cv2.line(annotated, points[start], points[end], (200, 200, 200), 2)
         
         # Draw angles
         if draw_angles:
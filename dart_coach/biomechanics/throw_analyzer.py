@@ -4,6 +4,7 @@ Throw Analyzer Module
 Complete dart throw biomechanical analysis system.
 """
 
+import heapq
 import json
 import logging
 import statistics
@@ -43,6 +44,13 @@ class ThrowAnalyzer:
         'body_lean': {'minor': 5, 'moderate': 10, 'significant': 20},
     }
     
+    # Quality score deductions per deviation severity
+    SEVERITY_DEDUCTIONS = {
+        'minor': 5,
+        'moderate': 10,
+        'significant': 20
+    }
+    
     def __init__(
         self,
         data_dir: Path,
@@ -104,8 +112,9 @@ class ThrowAnalyzer:
         Returns:
             Analysis session ID
         """
-        self._analysis_id = f"bio_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        self._start_time = datetime.now()
+        now = datetime.now()
+        self._analysis_id = f"bio_{now.strftime('%Y%m%d_%H%M%S')}"
+        self._start_time = now
         self._throws = []
         self._current_throw_frames = []
         self._throw_count = 0
@@ -214,8 +223,9 @@ class ThrowAnalyzer:
         if not video_path.exists():
             raise FileNotFoundError(f"Video file not found: {video_path}")
         
-        self._analysis_id = f"bio_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        self._start_time = datetime.now()
+        now = datetime.now()
+        self._analysis_id = f"bio_{now.strftime('%Y%m%d_%H%M%S')}"
+        self._start_time = now
         self._throws = []
         self._current_throw_frames = []
         self._throw_count = 0
@@ -409,15 +419,12 @@ class ThrowAnalyzer:
     
     def _find_release_frame(self, frames: List[PoseFrame]) -> Optional[PoseFrame]:
         """Find the frame closest to the release point."""
-        release_candidates = [f for f in frames if f.throw_phase in ['release', 'acceleration']]
-        
-        if not release_candidates:
-            return None
-        
-        # Find frame with maximum elbow extension
+        # Find frame with maximum elbow extension among release candidates
+        # in a single pass, without building the candidate list
         return max(
-            release_candidates,
-            key=lambda f: f.angles.get('elbow_angle', 0)
+            (f for f in frames if f.throw_phase in ('release', 'acceleration')),
+            key=lambda f: f.angles.get('elbow_angle', 0),
+            default=None
         )
     
     def _detect_wrist_snap(self, frames: List[PoseFrame]) -> bool:
@@ -527,15 +534,9 @@ class ThrowAnalyzer:
         score = 100.0
         
         # Deduction for deviations
-        severity_deductions = {
-            'minor': 5,
-            'moderate': 10,
-            'significant': 20
-        }
-        
         for deviation in deviations:
             severity = deviation.get('severity', 'minor')
-            score -= severity_deductions.get(severity, 5)
+            score -= self.SEVERITY_DEDUCTIONS.get(severity, 5)
         
         # Bonus for complete phases
         phases_detected = sum(
@@ -584,11 +585,11 @@ class ThrowAnalyzer:
             for dev in throw.get('deviations', []):
                 deviation_counts[dev['type']] += 1
         
-        # Sort deviations by frequency
-        most_common = sorted(
+        # Five most frequent deviations (all that the report uses)
+        most_common = heapq.nlargest(
+            5,
             deviation_counts.items(),
-            key=lambda x: x[1],
-            reverse=True
+            key=lambda x: x[1]
         )
         
         # Calculate release point variance
@@ -609,17 +610,15 @@ class ThrowAnalyzer:
         release_variance = 0
         avg_release_point = {}
         if len(release_points) >= 2:
-            xs, ys, zs = zip(*release_points)
+            # (N, 3) array so all three axes reduce in a single call
+            points = np.asarray(release_points, dtype=float)
+            mean_x, mean_y, mean_z = points.mean(axis=0)
             avg_release_point = {
-                'x': statistics.mean(xs),
-                'y': statistics.mean(ys),
-                'z': statistics.mean(zs)
+                'x': float(mean_x),
+                'y': float(mean_y),
+                'z': float(mean_z)
             }
-            release_variance = (
-                statistics.variance(xs) +
-                statistics.variance(ys) +
-                statistics.variance(zs)
-            )
+            release_variance = float(points.var(axis=0, ddof=1).sum())
         
         elbow_variance = statistics.variance(elbow_angles) if len(elbow_angles) >= 2 else 0
         
@@ -646,17 +645,24 @@ class ThrowAnalyzer:
             'improvement_areas': improvement_areas
         }
     
-    def save_results(self, filename: Optional[str] = None) -> Path:
+    def save_results(
+        self,
+        filename: Optional[str] = None,
+        results: Optional[Dict[str, Any]] = None
+    ) -> Path:
         """
         Save analysis results to JSON file.
         
         Args:
             filename: Optional filename (defaults to analysis_id.json)
+            results: Results already returned by a process_* call; computed
+                from the session if omitted
             
         Returns:
             Path to saved file
         """
-        results = self.get_analysis_results()
+        if results is None:
+            results = self.get_analysis_results()
         
         if filename is None:
             filename = f"{self._analysis_id}.json"
@@ -669,10 +675,14 @@ class ThrowAnalyzer:
         self.logger.info(f"Saved analysis results to {filepath}")
         return filepath
     
-    def stop_session(self) -> Path:
+    def stop_session(self, results: Optional[Dict[str, Any]] = None) -> Path:
         """
         Stop the current analysis session.
         
+        Args:
+            results: Results already returned by a process_* call, saved
+                as-is instead of being recomputed
+            
         Returns:
             Path to saved results file
         """
@@ -680,7 +690,7 @@ class ThrowAnalyzer:
         self.camera.stop_recording()
         
         # Save results
-        filepath = self.save_results()
+        filepath = self.save_results(results=results)
         
         # Cleanup
         self.camera.release()
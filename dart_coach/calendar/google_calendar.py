@@ -7,7 +7,7 @@ Integrates with Google Calendar for scheduling analysis reports.
 import json
 import logging
 import os
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -272,7 +272,7 @@ Generated by Dart Performance Coach
                 return []
         
         try:
-            now = datetime.utcnow().isoformat() + 'Z'
+            now = datetime.now(timezone.utc).isoformat()
             
             events_result = self.service.events().list(
                 calendarId=self.calendar_id,
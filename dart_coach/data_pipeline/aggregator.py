@@ -4,10 +4,11 @@ Data Aggregator Module
 Aggregates data from all sources for weekly analysis.
 """
 
+import heapq
 import json
 import logging
 import statistics
-from collections import defaultdict
+from collections import Counter, defaultdict
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -111,19 +112,24 @@ class DataAggregator:
         if not sessions:
             return {'sessions': 0}
         
-        # Separate by session type
-        practice_sessions = [
-            s for s in sessions
-            if s.get('session_type', '').endswith('practice')
-        ]
-        cpu_matches = [
-            s for s in sessions
-            if s.get('session_type') == 'cpu_match'
-        ]
-        online_matches = [
-            s for s in sessions
-            if s.get('session_type') == 'online_match'
-        ]
+        # Count session types and match results in one pass
+        practice_count = 0
+        match_results = {
+            'cpu_match': {'played': 0, 'won': 0, 'lost': 0},
+            'online_match': {'played': 0, 'won': 0, 'lost': 0}
+        }
+        for session in sessions:
+            session_type = session.get('session_type', '')
+            if session_type.endswith('practice'):
+                practice_count += 1
+            elif session_type in match_results:
+                record = match_results[session_type]
+                record['played'] += 1
+                result = session.get('match_result', {})
+                if result.get('won', False):
+                    record['won'] += 1
+                elif not result.get('won', True):
+                    record['lost'] += 1
         
         # Calculate aggregate metrics
         all_metrics = [s.get('metrics', {}) for s in sessions]
@@ -137,9 +143,9 @@ class DataAggregator:
         
         return {
             'sessions': len(sessions),
-            'practice_sessions': len(practice_sessions),
-            'cpu_matches': len(cpu_matches),
-            'online_matches': len(online_matches),
+            'practice_sessions': practice_count,
+            'cpu_matches': match_results['cpu_match']['played'],
+            'online_matches': match_results['online_match']['played'],
             'total_darts': safe_sum(m.get('total_darts', 0) for m in all_metrics),
             'total_duration_minutes': safe_sum(
                 s.get('duration_minutes', 0) for s in sessions
@@ -176,28 +182,8 @@ class DataAggregator:
                 )
             },
             'match_results': {
-                'cpu_matches': {
-                    'played': len(cpu_matches),
-                    'won': sum(
-                        1 for m in cpu_matches
-                        if m.get('match_result', {}).get('won', False)
-                    ),
-                    'lost': sum(
-                        1 for m in cpu_matches
-                        if not m.get('match_result', {}).get('won', True)
-                    )
-                },
-                'online_matches': {
-                    'played': len(online_matches),
-                    'won': sum(
-                        1 for m in online_matches
-                        if m.get('match_result', {}).get('won', False)
-                    ),
-                    'lost': sum(
-                        1 for m in online_matches
-                        if not m.get('match_result', {}).get('won', True)
-                    )
-                }
+                'cpu_matches': match_results['cpu_match'],
+                'online_matches': match_results['online_match']
             },
             'daily_breakdown': self._daily_breakdown(sessions, 'timestamp')
         }
@@ -210,22 +196,28 @@ class DataAggregator:
         if not matches:
             return {'matches': 0}
         
-        # Separate by match type
-        league_matches = [
-            m for m in matches
-            if m.get('match_type') == 'league_match'
-        ]
-        bar_matches = [
-            m for m in matches
-            if m.get('match_type') == 'bar_match'
-        ]
-        tournament_matches = [
-            m for m in matches
-            if 'tournament' in m.get('match_type', '')
-        ]
-        
         all_metrics = [m.get('metrics', {}) for m in matches]
-        all_results = [m.get('result', {}) for m in matches]
+        
+        # Match types, win/loss record, leg totals and deciding legs in one pass
+        type_counts = {'league_match': 0, 'bar_match': 0, 'tournament': 0}
+        overall_record = {'won': 0, 'lost': 0, 'legs_won': 0, 'legs_lost': 0}
+        deciding_legs_won = 0
+        for match in matches:
+            match_type = match.get('match_type', '')
+            if match_type in type_counts:
+                type_counts[match_type] += 1
+            elif 'tournament' in match_type:
+                type_counts['tournament'] += 1
+            
+            result = match.get('result', {})
+            if result.get('won', False):
+                overall_record['won'] += 1
+                if result.get('match_deciding_leg', False):
+                    deciding_legs_won += 1
+            elif not result.get('won', True):
+                overall_record['lost'] += 1
+            overall_record['legs_won'] += result.get('legs_won', 0) or 0
+            overall_record['legs_lost'] += result.get('legs_lost', 0) or 0
         
         def safe_avg(values):
             filtered = [v for v in values if v is not None and v > 0]
@@ -246,15 +238,10 @@ class DataAggregator:
         
         return {
             'matches': len(matches),
-            'league_matches': len(league_matches),
-            'bar_matches': len(bar_matches),
-            'tournament_matches': len(tournament_matches),
-            'overall_record': {
-                'won': sum(1 for r in all_results if r.get('won', False)),
-                'lost': sum(1 for r in all_results if not r.get('won', True)),
-                'legs_won': safe_sum(r.get('legs_won', 0) for r in all_results),
-                'legs_lost': safe_sum(r.get('legs_lost', 0) for r in all_results)
-            },
+            'league_matches': type_counts['league_match'],
+            'bar_matches': type_counts['bar_match'],
+            'tournament_matches': type_counts['tournament'],
+            'overall_record': overall_record,
             'metrics': {
                 'average_ppd': safe_avg(
                     m.get('points_per_dart', 0) for m in all_metrics
@@ -285,11 +272,7 @@ class DataAggregator:
                     (total_match_darts_converted / total_match_darts_thrown * 100)
                     if total_match_darts_thrown > 0 else 0
                 ),
-                'deciding_legs_won': sum(
-                    1 for m in matches
-                    if m.get('result', {}).get('match_deciding_leg', False)
-                    and m.get('result', {}).get('won', False)
-                )
+                'deciding_legs_won': deciding_legs_won
             },
             'venue_breakdown': self._venue_breakdown(matches),
             'opponent_analysis': self._opponent_analysis(matches)
@@ -303,26 +286,21 @@ class DataAggregator:
         if not analyses:
             return {'sessions': 0}
         
-        all_throws = []
-        for analysis in analyses:
-            all_throws.extend(analysis.get('throws', []))
-        
-        # Collect quality scores
-        quality_scores = [
-            t.get('throw_quality_score', 0) for t in all_throws
-        ]
-        
-        # Count deviations
+        # Collect quality scores, deviation counts and per-session
+        # consistency in one pass over sessions and their throws
+        total_throws = 0
+        quality_scores = []
         deviation_counts = defaultdict(int)
-        for throw in all_throws:
-            for dev in throw.get('deviations', []):
-                deviation_counts[dev['type']] += 1
-        
-        # Get aggregate stats from each session
-        consistency_scores = [
-            a.get('aggregate_analysis', {}).get('consistency_score', 0)
-            for a in analyses
-        ]
+        consistency_scores = []
+        for analysis in analyses:
+            consistency_scores.append(
+                analysis.get('aggregate_analysis', {}).get('consistency_score', 0)
+            )
+            for throw in analysis.get('throws', []):
+                total_throws += 1
+                quality_scores.append(throw.get('throw_quality_score', 0))
+                for dev in throw.get('deviations', []):
+                    deviation_counts[dev['type']] += 1
         
         def safe_avg(values):
             filtered = [v for v in values if v is not None and v > 0]
@@ -330,7 +308,7 @@ class DataAggregator:
         
         return {
             'sessions': len(analyses),
-            'total_throws_analyzed': len(all_throws),
+            'total_throws_analyzed': total_throws,
             'average_quality_score': safe_avg(quality_scores),
             'best_quality_score': max(quality_scores, default=0),
             'average_consistency_score': safe_avg(consistency_scores),
@@ -338,7 +316,7 @@ class DataAggregator:
                 {
                     'type': dev_type,
                     'count': count,
-                    'percentage': (count / len(all_throws) * 100) if all_throws else 0
+                    'percentage': (count / total_throws * 100) if total_throws else 0
                 }
                 for dev_type, count in sorted(
                     deviation_counts.items(),
@@ -361,29 +339,20 @@ class DataAggregator:
         for session in observations:
             all_obs.extend(session.get('observations', []))
         
-        # Category breakdown
+        # Category, sentiment, keyword and action item tallies in one pass
         category_counts = defaultdict(int)
-        for obs in all_obs:
-            for cat in obs.get('categories', []):
-                category_counts[cat] += 1
-        
-        # Sentiment breakdown
         sentiment_counts = {'positive': 0, 'neutral': 0, 'negative': 0}
-        for obs in all_obs:
-            sentiment = obs.get('sentiment', 'neutral')
-            sentiment_counts[sentiment] += 1
-        
-        # Collect all keywords
         keyword_counts = defaultdict(int)
+        all_action_items = []
         for obs in all_obs:
+            for cat in obs.get('categories', []):
+                category_counts[cat] += 1
+            sentiment_counts[obs.get('sentiment', 'neutral')] += 1
             for kw in obs.get('detected_keywords', []):
                 keyword_counts[kw] += 1
-        
-        # Collect action items
-        all_action_items = []
-        for obs in all_obs:
-            items = obs.get('parsed_insights', {}).get('action_items', [])
-            all_action_items.extend(items)
+            all_action_items.extend(
+                obs.get('parsed_insights', {}).get('action_items', [])
+            )
         
         return {
             'sessions': len(observations),
@@ -395,14 +364,14 @@ class DataAggregator:
             'sentiment_breakdown': sentiment_counts,
             'top_keywords': [
                 {'keyword': kw, 'count': count}
-                for kw, count in sorted(
+                for kw, count in heapq.nlargest(
+                    20,
                     keyword_counts.items(),
-                    key=lambda x: x[1],
-                    reverse=True
-                )[:20]
+                    key=lambda x: x[1]
+                )
             ],
             'action_items': list(set(all_action_items)),
-            'key_themes': self._extract_key_themes(all_obs)
+            'key_themes': self._extract_key_themes(keyword_counts)
         }
     
     def _daily_breakdown(
@@ -422,7 +391,7 @@ class DataAggregator:
                     else:
                         date = ts.date()
                     
-                    day_str = date.strftime('%Y-%m-%d')
+                    day_str = date.isoformat()
                     daily[day_str]['count'] += 1
                     daily[day_str]['records'].append(
                         record.get('session_id') or record.get('match_id')
@@ -540,25 +509,17 @@ class DataAggregator:
     
     def _extract_key_themes(
         self,
-        observations: List[Dict[str, Any]]
+        keyword_counts: Dict[str, int]
     ) -> List[str]:
-        """Extract key themes from observations."""
-        themes = []
-        
-        # Collect technique notes
-        technique_mentions = defaultdict(int)
-        for obs in observations:
-            for kw in obs.get('detected_keywords', []):
-                technique_mentions[kw] += 1
-        
+        """Extract key themes from already tallied observation keywords."""
         # Top themes
-        sorted_themes = sorted(
-            technique_mentions.items(),
-            key=lambda x: x[1],
-            reverse=True
+        top_themes = heapq.nlargest(
+            10,
+            keyword_counts.items(),
+            key=lambda x: x[1]
         )
         
-        return [theme for theme, _ in sorted_themes[:10]]
+        return [theme for theme, _ in top_themes]
     
     def _create_cross_references(
         self,
@@ -571,15 +532,17 @@ class DataAggregator:
         }
         
         # Link biomechanics sessions to practice sessions
+        scolia_ids = Counter(
+            scolia.get('session_id') for scolia in raw_data.get('scolia', [])
+        )
         for bio in raw_data.get('biomechanics', []):
             session_ref = bio.get('session_reference')
             if session_ref:
-                for scolia in raw_data.get('scolia', []):
-                    if scolia.get('session_id') == session_ref:
-                        cross_refs['session_links'].append({
-                            'biomechanics_id': bio.get('analysis_id'),
-                            'scolia_id': session_ref
-                        })
+                for _ in range(scolia_ids.get(session_ref, 0)):
+                    cross_refs['session_links'].append({
+                        'biomechanics_id': bio.get('analysis_id'),
+                        'scolia_id': session_ref
+                    })
         
         # Link voice observations to sessions
         for voice in raw_data.get('voice_observation', []):
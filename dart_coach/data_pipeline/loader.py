@@ -6,9 +6,10 @@ Loads data from various sources and formats.
 
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 
 class DataLoader:
@@ -43,6 +44,15 @@ class DataLoader:
             'voice_observation': self.base_data_dir / 'voice'
         }
         
+        # (mtime/size signature, parsed JSON, record date) keyed by path.
+        # Parsed JSON is only kept for files inside the last requested date
+        # range; other files keep just their date so they can be skipped
+        # without re-parsing.
+        self._file_cache: Dict[
+            str,
+            Tuple[Tuple[int, int], Optional[Dict[str, Any]], Optional[datetime]]
+        ] = {}
+        
         # Setup logging
         self.logger = logging.getLogger(self.__class__.__name__)
         self.logger.setLevel(getattr(logging, log_level.upper()))
@@ -69,12 +79,15 @@ class DataLoader:
         Returns:
             Dictionary of data lists keyed by source
         """
-        all_data = {}
-        
-        for source in self.DATA_SOURCES:
-            all_data[source] = self.load_source(source, start_date, end_date)
+        # Sources live in separate directories and share no state, so read
+        # them concurrently to overlap their file I/O
+        with ThreadPoolExecutor(max_workers=len(self.DATA_SOURCES)) as executor:
+            futures = {
+                source: executor.submit(self.load_source, source, start_date, end_date)
+                for source in self.DATA_SOURCES
+            }
         
-        return all_data
+        return {source: future.result() for source, future in futures.items()}
     
     def load_source(
         self,
@@ -85,6 +98,10 @@ class DataLoader:
         """
         Load data from a specific source.
         
+        Returned records are shallow copies of cached data: replacing
+        top-level keys is safe, but nested lists and dicts are shared with
+        the cache and must not be mutated in place.
+        
         Args:
             source: Data source name
             start_date: Optional start date filter
@@ -104,26 +121,39 @@ class DataLoader:
             return []
         
         records = []
+        seen_keys = set()
         
         for filepath in source_dir.glob('*.json'):
+            key = str(filepath)
+            seen_keys.add(key)
+            
             try:
-                data = self._load_json_file(filepath)
+                signature, data, record_date = self._load_cached_entry(filepath)
+                
+                # Apply date filter using the record date indexed at parse time
+                if record_date and (start_date or end_date):
+                    if (
+                        (start_date and record_date < start_date) or
+                        (end_date and record_date > end_date)
+                    ):
+                        self._file_cache[key] = (signature, None, record_date)
+                        continue
                 
-                # Apply date filter
-                if start_date or end_date:
-                    record_date = self._extract_date(data)
-                    if record_date:
-                        if start_date and record_date < start_date:
-                            continue
-                        if end_date and record_date > end_date:
-                            continue
+                if data is None:
+                    data = self._load_json_file(filepath)
                 
-                records.append(data)
+                self._file_cache[key] = (signature, data, record_date)
+                records.append(dict(data))
                 
             except Exception as e:
                 self.logger.error(f"Error loading {filepath}: {e}")
                 continue
         
+        # Forget files deleted since they were cached
+        for key in list(self._file_cache):
+            if key not in seen_keys and Path(key).parent == source_dir:
+                self._file_cache.pop(key, None)
+        
         self.logger.info(f"Loaded {len(records)} records from {source}")
         return records
     
@@ -137,6 +167,21 @@ class DataLoader:
         
         return data
     
+    def _load_cached_entry(
+        self,
+        filepath: Path
+    ) -> Tuple[Tuple[int, int], Optional[Dict[str, Any]], Optional[datetime]]:
+        """Return a file's signature, cached data and record date, re-reading if stale."""
+        stat = filepath.stat()
+        signature = (stat.st_mtime_ns, stat.st_size)
+        
+        cached = self._file_cache.get(str(filepath))
+        if cached is not None and cached[0] == signature:
+            return cached
+        
+        data = self._load_json_file(filepath)
+        return signature, data, self._extract_date(data)
+    
     def _extract_date(self, data: Dict[str, Any]) -> Optional[datetime]:
         """Extract timestamp from data record."""
         # Try common timestamp fields
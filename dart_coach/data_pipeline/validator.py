@@ -39,6 +39,7 @@ class DataValidator:
         """
         self.schema_dir = Path(schema_dir)
         self.schemas: Dict[str, dict] = {}
+        self._validators: Dict[str, Any] = {}
         
         # Setup logging
         self.logger = logging.getLogger(self.__class__.__name__)
@@ -84,21 +85,34 @@ class DataValidator:
         if source not in self.schemas:
             return True, []  # No schema to validate against
         
-        schema = self.schemas[source]
         errors = []
         
         try:
-            jsonschema.validate(instance=data, schema=schema)
-            return True, []
+            # Same error selection as jsonschema.validate, minus recompiling
+            error = jsonschema.exceptions.best_match(
+                self._get_validator(source).iter_errors(data)
+            )
+            if error is None:
+                return True, []
             
-        except jsonschema.ValidationError as e:
-            errors.append(f"Validation error at {e.json_path}: {e.message}")
+            errors.append(f"Validation error at {error.json_path}: {error.message}")
             
         except jsonschema.SchemaError as e:
             errors.append(f"Schema error: {e.message}")
         
         return False, errors
     
+    def _get_validator(self, source: str):
+        """Get the compiled validator for a source, checking its schema once."""
+        validator = self._validators.get(source)
+        if validator is None:
+            schema = self.schemas[source]
+            validator_cls = jsonschema.validators.validator_for(schema)
+            validator_cls.check_schema(schema)
+            validator = validator_cls(schema)
+            self._validators[source] = validator
+        return validator
+    
     def validate_batch(
         self,
         data_list: List[Dict[str, Any]],
@@ -8,19 +8,25 @@ import argparse
 import logging
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
 import yaml
 
 from . import DEFAULT_CONFIG_DIR, DEFAULT_DATA_DIR, DEFAULT_SCHEMA_DIR
-from .analysis.report_generator import ReportGenerator
-from .calendar.google_calendar import GoogleCalendarIntegration
-from .calendar.ical_generator import ICalGenerator
 from .data_pipeline.aggregator import DataAggregator
-from .scrapers.dart_connect_scraper import DartConnectScraper
-from .scrapers.scolia_scraper import ScoliaScraper
+
+# Scrapers, calendar clients and the report generator pull in browser
+# automation, Google API and HTTP client libraries; they are imported on
+# first use so CLI commands that do not need them start quickly.
+if TYPE_CHECKING:
+    from .analysis.report_generator import ReportGenerator
+    from .calendar.google_calendar import GoogleCalendarIntegration
+    from .calendar.ical_generator import ICalGenerator
+    from .scrapers.dart_connect_scraper import DartConnectScraper
+    from .scrapers.scolia_scraper import ScoliaScraper
 
 
 class DartCoach:
@@ -52,12 +58,12 @@ class DartCoach:
         self._setup_logging(log_level)
         
         # Initialize components (lazy loading)
-        self._scolia_scraper: Optional[ScoliaScraper] = None
-        self._dart_connect_scraper: Optional[DartConnectScraper] = None
+        self._scolia_scraper: Optional['ScoliaScraper'] = None
+        self._dart_connect_scraper: Optional['DartConnectScraper'] = None
         self._aggregator: Optional[DataAggregator] = None
-        self._report_generator: Optional[ReportGenerator] = None
-        self._calendar: Optional[GoogleCalendarIntegration] = None
-        self._ical: Optional[ICalGenerator] = None
+        self._report_generator: Optional['ReportGenerator'] = None
+        self._calendar: Optional['GoogleCalendarIntegration'] = None
+        self._ical: Optional['ICalGenerator'] = None
         
         self.logger.info("Dart Coach initialized")
     
@@ -97,9 +103,10 @@ class DartCoach:
             self.logger.addHandler(file_handler)
     
     @property
-    def scolia_scraper(self) -> ScoliaScraper:
+    def scolia_scraper(self) -> 'ScoliaScraper':
         """Get or create Scolia scraper."""
         if self._scolia_scraper is None:
+            from .scrapers.scolia_scraper import ScoliaScraper
             self._scolia_scraper = ScoliaScraper(
                 data_dir=self.data_dir / "scolia",
                 **self.config.get('scolia', {})
@@ -107,9 +114,10 @@ class DartCoach:
         return self._scolia_scraper
     
     @property
-    def dart_connect_scraper(self) -> DartConnectScraper:
+    def dart_connect_scraper(self) -> 'DartConnectScraper':
         """Get or create Dart Connect scraper."""
         if self._dart_connect_scraper is None:
+            from .scrapers.dart_connect_scraper import DartConnectScraper
             self._dart_connect_scraper = DartConnectScraper(
                 data_dir=self.data_dir / "dart_connect",
                 **self.config.get('dart_connect', {})
@@ -128,9 +136,10 @@ class DartCoach:
         return self._aggregator
     
     @property
-    def report_generator(self) -> ReportGenerator:
+    def report_generator(self) -> 'ReportGenerator':
         """Get or create report generator."""
         if self._report_generator is None:
+            from .analysis.report_generator import ReportGenerator
             self._report_generator = ReportGenerator(
                 data_dir=self.data_dir,
                 output_dir=self.data_dir / "reports",
@@ -139,18 +148,20 @@ class DartCoach:
         return self._report_generator
     
     @property
-    def calendar(self) -> GoogleCalendarIntegration:
+    def calendar(self) -> 'GoogleCalendarIntegration':
         """Get or create Google Calendar integration."""
         if self._calendar is None:
+            from .calendar.google_calendar import GoogleCalendarIntegration
             self._calendar = GoogleCalendarIntegration(
                 **self.config.get('calendar', {})
             )
         return self._calendar
     
     @property
-    def ical(self) -> ICalGenerator:
+    def ical(self) -> 'ICalGenerator':
         """Get or create iCal generator."""
         if self._ical is None:
+            from .calendar.ical_generator import ICalGenerator
             self._ical = ICalGenerator(
                 output_dir=self.data_dir / "calendar"
             )
@@ -332,10 +343,14 @@ class DartCoach:
         }
         
         try:
-            # Step 1: Scrape data
+            # Step 1: Scrape data (the two sites are independent and
+            # network bound, so scrape them concurrently)
             if scrape:
-                results['scraping']['scolia'] = self.scrape_scolia()
-                results['scraping']['dart_connect'] = self.scrape_dart_connect()
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    scolia_future = executor.submit(self.scrape_scolia)
+                    dart_connect_future = executor.submit(self.scrape_dart_connect)
+                    results['scraping']['scolia'] = scolia_future.result()
+                    results['scraping']['dart_connect'] = dart_connect_future.result()
             
             # Step 2: Aggregate data
             aggregated = self.aggregate_weekly_data()
@@ -593,7 +608,7 @@ def main():
         else:
             analyzer.start_session()
             results = analyzer.process_live(args.duration, display=args.display)
-            analyzer.stop_session()
+            analyzer.stop_session(results)
         
         print(f"Analyzed {results.get('total_throws_analyzed', 0)} throws")
     
@@ -63,6 +63,7 @@ class BaseScraper(ABC):
         self.session = self._create_session()
         self._authenticated = False
         self._auth_expiry: Optional[datetime] = None
+        self._issued_id_counts: Dict[str, int] = {}
     
     def _create_session(self) -> requests.Session:
         """Create a requests session with retry configuration."""
@@ -254,17 +255,52 @@ class BaseScraper(ABC):
         
         filepath = load_dir / filename
         
-        if not filepath.exists():
+        try:
+            with open(filepath, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
             self.logger.warning(f"File not found: {filepath}")
             return None
+    
+    def generate_session_id(
+        self,
+        prefix: str,
+        timestamp: Optional[Any] = None
+    ) -> str:
+        """
+        Generate a unique session ID from a record's timestamp.
+        
+        IDs have one-second resolution. When this scraper has already
+        issued an ID for the same second, a numeric suffix (_2, _3, ...)
+        is appended to keep it unique.
+        
+        Args:
+            prefix: ID prefix for the data source
+            timestamp: Record time as a datetime or ISO 8601 string; the
+                current time is used if missing or unparseable
+            
+        Returns:
+            Session ID
+        """
+        moment = self._parse_timestamp(timestamp) or datetime.now()
+        base_id = f"{prefix}_{moment.strftime('%Y%m%d_%H%M%S')}"
+        
+        count = self._issued_id_counts.get(base_id, 0) + 1
+        self._issued_id_counts[base_id] = count
         
-        with open(filepath, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return base_id if count == 1 else f"{base_id}_{count}"
     
-    def generate_session_id(self, prefix: str) -> str:
-        """Generate a unique session ID with timestamp."""
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        return f"{prefix}_{timestamp}"
+    @staticmethod
+    def _parse_timestamp(timestamp: Optional[Any]) -> Optional[datetime]:
+        """Parse a datetime or ISO 8601 string, returning None if invalid."""
+        if isinstance(timestamp, datetime):
+            return timestamp
+        if isinstance(timestamp, str) and timestamp:
+            try:
+                return datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+            except ValueError:
+                return None
+        return None
     
     def rate_limit(self, delay: float = 1.0):
         """Apply rate limiting between requests."""
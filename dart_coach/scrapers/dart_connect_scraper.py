@@ -519,7 +519,9 @@ class DartConnectScraper(BaseScraper):
         """
         match_id = raw_data.get('match_id', '')
         if not match_id.startswith('dc_'):
-            match_id = f"dc_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            match_id = self.generate_session_id(
+                'dc', raw_data.get('timestamp')
+            )
         
         # Extract nested data
         competition = raw_data.get('competition', {})
@@ -531,9 +533,14 @@ class DartConnectScraper(BaseScraper):
         # Determine match type
         match_type = self._determine_match_type(raw_data)
         
+        # Only read the clock when the source omitted a timestamp
+        timestamp = raw_data.get('timestamp')
+        if timestamp is None:
+            timestamp = datetime.now().isoformat()
+        
         transformed = {
             "match_id": match_id,
-            "timestamp": raw_data.get('timestamp', datetime.now().isoformat()),
+            "timestamp": timestamp,
             "data_source": self.DATA_SOURCE,
             "context": self.CONTEXT,
             "match_type": match_type,
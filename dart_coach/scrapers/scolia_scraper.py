@@ -435,7 +435,9 @@ class ScoliaScraper(BaseScraper):
         """
         session_id = raw_data.get('session_id', '')
         if not session_id.startswith('scolia_'):
-            session_id = f"scolia_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            session_id = self.generate_session_id(
+                'scolia', raw_data.get('timestamp')
+            )
         
         # Determine session type and context
         game_info = raw_data.get('game_info', {})
@@ -445,9 +447,14 @@ class ScoliaScraper(BaseScraper):
         # Transform metrics
         raw_metrics = raw_data.get('metrics', {})
         
+        # Only read the clock when the source omitted a timestamp
+        timestamp = raw_data.get('timestamp')
+        if timestamp is None:
+            timestamp = datetime.now().isoformat()
+        
         transformed = {
             "session_id": session_id,
-            "timestamp": raw_data.get('timestamp', datetime.now().isoformat()),
+            "timestamp": timestamp,
             "data_source": self.DATA_SOURCE,
             "context": context,
             "session_type": session_type,
@@ -136,7 +136,7 @@ class TestOllamaAnalyzer:
         # Should identify practice-to-competition gap
         assert 'gap' in areas.lower() or len(areas) > 0
     
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_call_ollama_success(self, mock_post, analyzer):
         """Test successful Ollama API call."""
         mock_response = Mock()
@@ -149,7 +149,7 @@ class TestOllamaAnalyzer:
         assert result == 'Test analysis response'
         mock_post.assert_called_once()
     
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_call_ollama_connection_error(self, mock_post, analyzer):
         """Test Ollama connection error handling."""
         import requests
@@ -159,7 +159,7 @@ class TestOllamaAnalyzer:
         
         assert result == ''
     
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_check_connection_success(self, mock_get, analyzer):
         """Test connection check success."""
         mock_response = Mock()
@@ -168,7 +168,7 @@ class TestOllamaAnalyzer:
         
         assert analyzer.check_connection() is True
     
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_check_connection_failure(self, mock_get, analyzer):
         """Test connection check failure."""
         mock_get.side_effect = Exception('Connection failed')
@@ -288,7 +288,54 @@ class TestReportGenerator:
         
         assert 'executive_summary' in analysis
         assert 'AI analysis unavailable' in analysis['executive_summary']
-    
+
+    def test_generate_ai_analysis_collects_all_sections(self, report_generator, sample_aggregated_data):
+        """Test concurrent AI analysis keeps each response in its section."""
+        analyzer = report_generator.analyzer
+        with patch.object(analyzer, 'analyze_weekly_performance', return_value='weekly'), \
+             patch.object(analyzer, 'analyze_trends', return_value='trends'), \
+             patch.object(analyzer, 'analyze_biomechanics', return_value='bio'), \
+             patch.object(analyzer, 'analyze_mental_game', return_value='mental'), \
+             patch.object(analyzer, 'recommend_drills', return_value='drills'), \
+             patch.object(analyzer, 'set_goals', return_value='goals'):
+            analysis = report_generator._generate_ai_analysis(
+                sample_aggregated_data,
+                None
+            )
+
+        assert analysis['raw_analysis'] == {
+            'weekly': 'weekly',
+            'trends': 'trends',
+            'biomechanics': 'bio',
+            'mental': 'mental',
+            'drills': 'drills',
+            'goals': 'goals'
+        }
+
+    def test_generate_ai_analysis_respects_concurrency_limit(self, report_generator, sample_aggregated_data):
+        """Test AI analysis sends no more requests at once than configured."""
+        import threading
+        import time
+
+        lock = threading.Lock()
+        state = {'active': 0, 'peak': 0}
+
+        def fake_call(prompt, system_prompt=None):
+            with lock:
+                state['active'] += 1
+                state['peak'] = max(state['peak'], state['active'])
+            time.sleep(0.01)
+            with lock:
+                state['active'] -= 1
+            return 'response'
+
+        analyzer = report_generator.analyzer
+        assert analyzer.max_concurrent_requests == 1
+        with patch.object(analyzer, '_call_ollama', side_effect=fake_call):
+            report_generator._generate_ai_analysis(sample_aggregated_data, None)
+
+        assert state['peak'] == 1
+
     def test_report_to_markdown(self, report_generator):
         """Test converting report to markdown."""
         report = {
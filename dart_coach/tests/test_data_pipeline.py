@@ -72,6 +72,49 @@ class TestDataLoader:
             assert len(records) == 1
             assert records[0]['session_id'] == 'scolia_1'
 
+    def test_reload_after_file_change(self):
+        """Test cached files are re-read once modified."""
+        with TemporaryDirectory() as tmpdir:
+            tmppath = Path(tmpdir)
+            (tmppath / 'scolia').mkdir()
+            filepath = tmppath / 'scolia' / 'test.json'
+
+            with open(filepath, 'w') as f:
+                json.dump({'session_id': 'scolia_a'}, f)
+
+            loader = DataLoader(tmppath)
+            assert loader.load_source('scolia')[0]['session_id'] == 'scolia_a'
+
+            with open(filepath, 'w') as f:
+                json.dump({'session_id': 'scolia_bb'}, f)
+
+            records = loader.load_source('scolia')
+            assert records[0]['session_id'] == 'scolia_bb'
+
+    def test_cache_holds_only_requested_files(self):
+        """Test filtered-out and deleted files do not keep parsed data cached."""
+        with TemporaryDirectory() as tmpdir:
+            tmppath = Path(tmpdir)
+            (tmppath / 'scolia').mkdir()
+
+            for name, date in [('old', '2024-01-01'), ('new', '2024-01-05')]:
+                with open(tmppath / 'scolia' / f'{name}.json', 'w') as f:
+                    json.dump({'session_id': name, 'timestamp': f'{date}T12:00:00'}, f)
+
+            loader = DataLoader(tmppath)
+            loader.load_source('scolia', start_date=datetime(2024, 1, 3))
+
+            old_key = str(tmppath / 'scolia' / 'old.json')
+            new_key = str(tmppath / 'scolia' / 'new.json')
+            assert loader._file_cache[old_key][1] is None
+            assert loader._file_cache[new_key][1]['session_id'] == 'new'
+
+            (tmppath / 'scolia' / 'new.json').unlink()
+            records = loader.load_source('scolia')
+
+            assert [r['session_id'] for r in records] == ['old']
+            assert new_key not in loader._file_cache
+
 
 class TestDataValidator:
     """Tests for DataValidator class."""
@@ -222,6 +265,32 @@ class TestDataAggregator:
         
         assert loaded['practice_data']['sessions'] == 1
 
+    def test_cross_references(self, aggregator_setup):
+        """Test biomechanics sessions link to matching Scolia sessions."""
+        raw_data = {
+            'scolia': [
+                {'session_id': 'scolia_20240101_120000'},
+                {'session_id': 'scolia_20240102_120000'}
+            ],
+            'biomechanics': [
+                {
+                    'analysis_id': 'bio_20240101_120500',
+                    'session_reference': 'scolia_20240101_120000'
+                },
+                {
+                    'analysis_id': 'bio_20240103_120500',
+                    'session_reference': 'scolia_20240103_120000'
+                }
+            ]
+        }
+
+        cross_refs = aggregator_setup._create_cross_references(raw_data)
+
+        assert cross_refs['session_links'] == [{
+            'biomechanics_id': 'bio_20240101_120500',
+            'scolia_id': 'scolia_20240101_120000'
+        }]
+
 
 class TestIntegration:
     """Integration tests for the data pipeline."""
@@ -0,0 +1,75 @@
+"""
+Tests for the scrapers module.
+"""
+
+import pytest
+from datetime import datetime
+from typing import Any, Dict, List
+
+# The scrapers package imports its browser-automation dependencies on load
+pytest.importorskip('bs4')
+pytest.importorskip('selenium')
+pytest.importorskip('webdriver_manager')
+
+from dart_coach.scrapers.base_scraper import BaseScraper
+
+
+class StubScraper(BaseScraper):
+    """Minimal concrete scraper for exercising BaseScraper helpers."""
+
+    def authenticate(self, username: str, password: str) -> bool:
+        return True
+
+    def fetch_sessions(
+        self,
+        start_date: datetime,
+        end_date: datetime
+    ) -> List[Dict[str, Any]]:
+        return []
+
+    def fetch_session_details(self, session_id: str) -> Dict[str, Any]:
+        return {}
+
+    def transform_to_schema(self, raw_data: Dict[str, Any]) -> Dict[str, Any]:
+        return raw_data
+
+
+class TestGenerateSessionId:
+    """Tests for BaseScraper.generate_session_id."""
+
+    @pytest.fixture
+    def scraper(self, tmp_path):
+        """Create a stub scraper instance."""
+        return StubScraper(base_url='http://example.com', data_dir=tmp_path)
+
+    def test_uses_record_timestamp(self, scraper):
+        """Test IDs are built from the record's own timestamp."""
+        session_id = scraper.generate_session_id('scolia', '2024-01-05T18:30:15')
+        assert session_id == 'scolia_20240105_183015'
+
+    def test_batch_ids_follow_record_times(self, scraper):
+        """Test a backfill does not drift IDs away from record timestamps."""
+        ids = [
+            scraper.generate_session_id('dc', datetime(2024, 1, day, 19, 0, 0))
+            for day in range(1, 29)
+        ]
+        assert ids[-1] == 'dc_20240128_190000'
+        assert len(set(ids)) == len(ids)
+
+    def test_same_second_gets_suffix(self, scraper):
+        """Test repeated timestamps get a numeric collision suffix."""
+        first = scraper.generate_session_id('scolia', '2024-01-05T18:30:15')
+        second = scraper.generate_session_id('scolia', '2024-01-05T18:30:15')
+        assert first == 'scolia_20240105_183015'
+        assert second == 'scolia_20240105_183015_2'
+
+    def test_invalid_timestamp_falls_back_to_clock(self, scraper):
+        """Test unparseable timestamps use the current time."""
+        before = datetime.now().replace(microsecond=0)
+        session_id = scraper.generate_session_id('scolia', 'Jan 5th')
+        issued = datetime.strptime(session_id[len('scolia_'):], '%Y%m%d_%H%M%S')
+        assert issued >= before
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
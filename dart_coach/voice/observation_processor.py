@@ -4,9 +4,11 @@ Observation Processor Module
 Processes transcribed voice observations and extracts insights.
 """
 
+import heapq
 import json
 import logging
 import re
+import threading
 from collections import defaultdict
 from datetime import datetime
 from pathlib import Path
@@ -65,6 +67,13 @@ class ObservationProcessor:
         ]
     }
     
+    # All category keywords, de-duplicated once in first-seen order
+    ALL_KEYWORDS = tuple(dict.fromkeys(
+        keyword
+        for keywords in CATEGORY_KEYWORDS.values()
+        for keyword in keywords
+    ))
+    
     # Sentiment indicators
     POSITIVE_WORDS = [
         'good', 'great', 'excellent', 'perfect', 'nice', 'better',
@@ -78,6 +87,11 @@ class ObservationProcessor:
         'miss', 'missed', 'off', 'wrong', 'problem', 'issue', 'no'
     ]
     
+    # Phrases that mark a sentence as an action item
+    ACTION_PATTERN = re.compile(
+        r"need to|should|try to|remember to|focus on|work on|don't forget"
+    )
+    
     def __init__(
         self,
         data_dir: Path,
@@ -107,6 +121,7 @@ class ObservationProcessor:
         self._observation_id: Optional[str] = None
         self._start_time: Optional[datetime] = None
         self._observations: List[Dict[str, Any]] = []
+        self._prewarm_thread: Optional[threading.Thread] = None
         
         # Setup logging
         self.logger = logging.getLogger(self.__class__.__name__)
@@ -129,8 +144,9 @@ class ObservationProcessor:
         Returns:
             Observation session ID
         """
-        self._observation_id = f"voice_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        self._start_time = datetime.now()
+        now = datetime.now()
+        self._observation_id = f"voice_{now.strftime('%Y%m%d_%H%M%S')}"
+        self._start_time = now
         self._observations = []
         
         if session_reference:
@@ -139,6 +155,15 @@ class ObservationProcessor:
         # Start recording
         self.recorder.start_recording(self._observation_id)
         
+        # Load the Whisper model while recording so transcription can start
+        # as soon as the session stops
+        if self.transcriber.model is None:
+            self._prewarm_thread = threading.Thread(
+                target=self._prewarm_transcriber,
+                daemon=True
+            )
+            self._prewarm_thread.start()
+        
         self.logger.info(f"Started observation session: {self._observation_id}")
         return self._observation_id
     
@@ -152,6 +177,11 @@ class ObservationProcessor:
         # Stop recording
         session_id, chunk_files = self.recorder.stop_recording()
         
+        # Wait for a model load still in progress
+        if self._prewarm_thread is not None:
+            self._prewarm_thread.join()
+            self._prewarm_thread = None
+        
         # Transcribe all chunks
         transcriptions = self.transcriber.transcribe_chunks(chunk_files)
         
@@ -170,10 +200,23 @@ class ObservationProcessor:
         
         return results
     
+    def _prewarm_transcriber(self):
+        """Load the transcription model in the background."""
+        try:
+            self.transcriber.initialize(log_errors=False)
+        except Exception as e:
+            # Transcription retries the load and reports the failure
+            self.logger.debug(f"Background model load failed: {e}")
+    
     def _process_transcriptions(self, transcriptions: List[Dict[str, Any]]):
         """Process transcriptions into structured observations."""
         observation_number = 0
         
+        # Every observation shares the session start time
+        timestamp_absolute = (
+            self._start_time.isoformat() if self._start_time else None
+        )
+        
         for trans in transcriptions:
             for segment in trans.get('segments', []):
                 text = segment.get('text', '').strip()
@@ -186,10 +229,7 @@ class ObservationProcessor:
                 observation = {
                     'observation_number': observation_number,
                     'timestamp_offset': segment['start'],
-                    'timestamp_absolute': (
-                        self._start_time.isoformat()
-                        if self._start_time else None
-                    ),
+                    'timestamp_absolute': timestamp_absolute,
                     'transcription': text,
                     'duration_seconds': segment['end'] - segment['start'],
                     'confidence': self._convert_logprob_to_confidence(
@@ -233,17 +273,8 @@ class ObservationProcessor:
     def _extract_keywords(self, text: str) -> List[str]:
         """Extract relevant keywords from observation."""
         text_lower = text.lower()
-        found_keywords = []
-        
-        all_keywords = []
-        for keywords in self.CATEGORY_KEYWORDS.values():
-            all_keywords.extend(keywords)
-        
-        for keyword in set(all_keywords):
-            if keyword in text_lower:
-                found_keywords.append(keyword)
         
-        return found_keywords
+        return [keyword for keyword in self.ALL_KEYWORDS if keyword in text_lower]
     
     def _analyze_sentiment(self, text: str) -> str:
         """Analyze sentiment of observation."""
@@ -280,7 +311,6 @@ class ObservationProcessor:
             'action_items': []
         }
         
-        text_lower = text.lower()
         sentences = re.split(r'[.!?]+', text)
         
         for sentence in sentences:
@@ -301,12 +331,7 @@ class ObservationProcessor:
                 insights['physical_notes'].append(sentence)
             
             # Detect action items
-            action_patterns = [
-                r'need to', r'should', r'try to', r'remember to',
-                r'focus on', r'work on', r"don't forget"
-            ]
-            
-            if any(re.search(pattern, sentence_lower) for pattern in action_patterns):
+            if self.ACTION_PATTERN.search(sentence_lower):
                 insights['action_items'].append(sentence)
         
         return insights
@@ -340,66 +365,54 @@ class ObservationProcessor:
         if not self._observations:
             return {}
         
-        # Category breakdown
+        # Tally categories, sentiment, keywords, recurring issues, positive
+        # observations and action items in a single pass
         category_counts = defaultdict(int)
+        sentiment_counts = {'positive': 0, 'neutral': 0, 'negative': 0}
+        keyword_counts = defaultdict(int)
+        issue_counts = defaultdict(int)
+        positive_obs = []
+        focus_areas = []
+        
         for obs in self._observations:
             for cat in obs.get('categories', []):
                 category_counts[cat] += 1
-        
-        # Sentiment breakdown
-        sentiment_counts = {'positive': 0, 'neutral': 0, 'negative': 0}
-        for obs in self._observations:
+            
             sentiment = obs.get('sentiment', 'neutral')
             sentiment_counts[sentiment] += 1
-        
-        # Extract key themes
-        all_keywords = []
-        for obs in self._observations:
-            all_keywords.extend(obs.get('detected_keywords', []))
-        
-        keyword_counts = defaultdict(int)
-        for kw in all_keywords:
-            keyword_counts[kw] += 1
+            
+            keywords = obs.get('detected_keywords', [])
+            for kw in keywords:
+                keyword_counts[kw] += 1
+            
+            # Recurring issues come from negative observations
+            if sentiment == 'negative':
+                for kw in keywords:
+                    issue_counts[kw] += 1
+            elif sentiment == 'positive' and len(positive_obs) < 5:
+                positive_obs.append(obs['transcription'])
+            
+            focus_areas.extend(obs.get('parsed_insights', {}).get('action_items', []))
         
         key_themes = [
-            kw for kw, count in sorted(
+            kw for kw, count in heapq.nlargest(
+                10,
                 keyword_counts.items(),
-                key=lambda x: x[1],
-                reverse=True
-            )[:10]
+                key=lambda x: x[1]
+            )
         ]
         
-        # Identify recurring issues (negative observations with similar keywords)
-        negative_obs = [
-            obs for obs in self._observations
-            if obs.get('sentiment') == 'negative'
-        ]
-        
-        issue_counts = defaultdict(int)
-        for obs in negative_obs:
-            for kw in obs.get('detected_keywords', []):
-                issue_counts[kw] += 1
-        
         recurring_issues = [
             {'issue': issue, 'frequency': count}
-            for issue, count in sorted(
+            for issue, count in heapq.nlargest(
+                5,
                 issue_counts.items(),
-                key=lambda x: x[1],
-                reverse=True
-            )[:5]
+                key=lambda x: x[1]
+            )
             if count >= 2
         ]
         
-        # Collect positive observations
-        positive_obs = [
-            obs['transcription'] for obs in self._observations
-            if obs.get('sentiment') == 'positive'
-        ][:5]
-        
         # Identify focus areas from action items
-        focus_areas = []
-        for obs in self._observations:
-            focus_areas.extend(obs.get('parsed_insights', {}).get('action_items', []))
         focus_areas = list(set(focus_areas))[:5]
         
         return {
@@ -442,8 +455,9 @@ class ObservationProcessor:
         if not audio_path.exists():
             raise FileNotFoundError(f"Audio file not found: {audio_path}")
         
-        self._observation_id = f"voice_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        self._start_time = datetime.now()
+        now = datetime.now()
+        self._observation_id = f"voice_{now.strftime('%Y%m%d_%H%M%S')}"
+        self._start_time = now
         self._observations = []
         self.session_reference = session_reference
         
@@ -462,6 +476,11 @@ class ObservationProcessor:
     
     def release(self):
         """Release resources."""
+        # Let a background model load finish so its reference is released too
+        if self._prewarm_thread is not None:
+            self._prewarm_thread.join()
+            self._prewarm_thread = None
+        
         self.transcriber.release()
     
     def __enter__(self):
@@ -5,6 +5,7 @@ Audio transcription using Whisper for voice observations.
 """
 
 import logging
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -18,8 +19,22 @@ class Transcriber:
     
     Provides timestamped transcriptions for synchronization
     with throw data.
+    
+    Transcribers using the same model name share one loaded Whisper
+    model. The model is freed when the last of them is released, and
+    transcription calls on a shared model are serialized because
+    Whisper's decoder installs kv-cache hooks on the model while it runs.
     """
     
+    # Loaded Whisper models shared by all instances, keyed by model name,
+    # with the number of initialized transcribers holding each one
+    _model_cache: Dict[str, Any] = {}
+    _model_refcounts: Dict[str, int] = {}
+    _model_cache_lock = threading.Lock()
+    
+    # Per-model locks serializing inference on a shared model
+    _inference_locks: Dict[str, threading.Lock] = {}
+    
     def __init__(
         self,
         model_name: str = "base",
@@ -37,6 +52,7 @@ class Transcriber:
         self.model_name = model_name
         self.language = language
         self.model = None
+        self._inference_lock: Optional[threading.Lock] = None
         
         # Setup logging
         self.logger = logging.getLogger(self.__class__.__name__)
@@ -49,22 +65,48 @@ class Transcriber:
             ))
             self.logger.addHandler(handler)
     
-    def initialize(self):
-        """Initialize the Whisper model."""
+    def initialize(self, log_errors: bool = True):
+        """
+        Initialize the Whisper model.
+        
+        Models are loaded once per model name and shared between
+        transcribers, so repeated sessions skip the load. Calling this
+        on an initialized transcriber does nothing.
+        
+        Args:
+            log_errors: Log load failures before re-raising them
+        """
         try:
-            import whisper
-            
-            self.logger.info(f"Loading Whisper model: {self.model_name}")
-            self.model = whisper.load_model(self.model_name)
-            self.logger.info("Whisper model loaded successfully")
+            with self._model_cache_lock:
+                if self.model is not None:
+                    return
+                
+                model = self._model_cache.get(self.model_name)
+                if model is None:
+                    import whisper
+                    
+                    self.logger.info(f"Loading Whisper model: {self.model_name}")
+                    model = whisper.load_model(self.model_name)
+                    self._model_cache[self.model_name] = model
+                    self.logger.info("Whisper model loaded successfully")
+                
+                self._model_refcounts[self.model_name] = (
+                    self._model_refcounts.get(self.model_name, 0) + 1
+                )
+                self._inference_lock = self._inference_locks.setdefault(
+                    self.model_name, threading.Lock()
+                )
+                self.model = model
             
         except ImportError:
-            self.logger.error(
-                "Whisper not installed. Install with: pip install openai-whisper"
-            )
+            if log_errors:
+                self.logger.error(
+                    "Whisper not installed. Install with: pip install openai-whisper"
+                )
             raise
         except Exception as e:
-            self.logger.error(f"Failed to load Whisper model: {e}")
+            if log_errors:
+                self.logger.error(f"Failed to load Whisper model: {e}")
             raise
     
     def transcribe_file(
@@ -93,12 +135,13 @@ class Transcriber:
         
         try:
             # Transcribe with word-level timestamps
-            result = self.model.transcribe(
-                str(audio_path),
-                language=self.language,
-                word_timestamps=True,
-                verbose=False
-            )
+            with self._inference_lock:
+                result = self.model.transcribe(
+                    str(audio_path),
+                    language=self.language,
+                    word_timestamps=True,
+                    verbose=False
+                )
             
             # Process segments
             segments = []
@@ -212,7 +255,8 @@ class Transcriber:
             
             # Decode
             options = whisper.DecodingOptions(language=self.language)
-            result = whisper.decode(self.model, mel, options)
+            with self._inference_lock:
+                result = whisper.decode(self.model, mel, options)
             
             return {
                 'text': result.text.strip(),
@@ -237,11 +281,26 @@ class Transcriber:
             }
     
     def release(self):
-        """Release model resources."""
-        if self.model is not None:
-            del self.model
+        """Release the model, freeing it once no other transcriber uses it."""
+        with self._model_cache_lock:
+            if self.model is None:
+                return
+            
             self.model = None
-            self.logger.info("Whisper model released")
+            self._inference_lock = None
+            
+            remaining = self._model_refcounts.get(self.model_name, 0) - 1
+            if remaining > 0:
+                self._model_refcounts[self.model_name] = remaining
+                self.logger.debug(
+                    f"Whisper model still used by {remaining} transcriber(s)"
+                )
+                return
+            
+            self._model_refcounts.pop(self.model_name, None)
+            self._model_cache.pop(self.model_name, None)
+        
+        self.logger.info("Whisper model released")
     
     def __enter__(self):
         """Context manager entry."""
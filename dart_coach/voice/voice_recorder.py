@@ -8,6 +8,7 @@ import logging
 import os
 import queue
 import threading
+import time
 import wave
 from datetime import datetime
 from pathlib import Path
@@ -63,8 +64,10 @@ class VoiceRecorder:
         self._recording = False
         self._audio_queue: queue.Queue = queue.Queue()
         self._recording_thread: Optional[threading.Thread] = None
+        # Completed chunks as (start offset, 16-bit PCM samples)
         self._chunks: List[Tuple[float, np.ndarray]] = []
         self._start_time: Optional[datetime] = None
+        self._start_monotonic: float = 0.0
         self._session_id: Optional[str] = None
         
         # Setup logging
@@ -84,13 +87,17 @@ class VoiceRecorder:
             self.logger.warning(f"Audio callback status: {status}")
         
         if self._recording:
-            elapsed = (datetime.now() - self._start_time).total_seconds()
+            # Monotonic clock: cheap on the audio thread and immune to
+            # wall-clock adjustments mid-recording
+            elapsed = time.monotonic() - self._start_monotonic
             self._audio_queue.put((elapsed, indata.copy()))
     
     def _recording_worker(self):
         """Worker thread for processing audio chunks."""
         current_chunk = []
         chunk_start_time = 0
+        chunk_samples = 0
+        samples_per_chunk = self.chunk_duration * self.sample_rate
         
         while self._recording or not self._audio_queue.empty():
             try:
@@ -101,37 +108,40 @@ class VoiceRecorder:
                 
                 current_chunk.append(data)
                 
-                # Calculate current chunk duration
-                chunk_samples = sum(len(d) for d in current_chunk)
-                chunk_duration = chunk_samples / self.sample_rate
+                # Track chunk length incrementally rather than re-summing blocks
+                chunk_samples += len(data)
                 
                 # Save chunk if duration exceeded
-                if chunk_duration >= self.chunk_duration:
-                    audio_data = np.concatenate(current_chunk, axis=0)
+                if chunk_samples >= samples_per_chunk:
+                    audio_data = self._to_pcm16(np.concatenate(current_chunk, axis=0))
                     self._chunks.append((chunk_start_time, audio_data))
                     
                     # Save chunk to file
                     self._save_chunk(chunk_start_time, audio_data)
                     
                     current_chunk = []
+                    chunk_samples = 0
                     
             except queue.Empty:
                 continue
         
         # Save remaining audio
         if current_chunk:
-            audio_data = np.concatenate(current_chunk, axis=0)
+            audio_data = self._to_pcm16(np.concatenate(current_chunk, axis=0))
             self._chunks.append((chunk_start_time, audio_data))
             self._save_chunk(chunk_start_time, audio_data)
     
-    def _save_chunk(self, start_time: float, audio_data: np.ndarray) -> Path:
-        """Save audio chunk to WAV file."""
+    @staticmethod
+    def _to_pcm16(audio_data: np.ndarray) -> np.ndarray:
+        """Convert float audio in [-1, 1] to 16-bit PCM, scaling the input in place."""
+        np.multiply(audio_data, 32767, out=audio_data)
+        return audio_data.astype(np.int16)
+    
+    def _save_chunk(self, start_time: float, audio_int16: np.ndarray) -> Path:
+        """Save 16-bit PCM audio chunk to WAV file."""
         filename = f"{self._session_id}_chunk_{int(start_time):04d}.wav"
         filepath = self.output_dir / filename
         
-        # Convert to 16-bit PCM
-        audio_int16 = (audio_data * 32767).astype(np.int16)
-        
         with wave.open(str(filepath), 'wb') as wf:
             wf.setnchannels(self.channels)
             wf.setsampwidth(2)  # 16-bit
@@ -155,8 +165,10 @@ class VoiceRecorder:
             self.logger.warning("Already recording")
             return self._session_id
         
-        self._session_id = session_id or f"voice_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        self._start_time = datetime.now()
+        now = datetime.now()
+        self._session_id = session_id or f"voice_{now.strftime('%Y%m%d_%H%M%S')}"
+        self._start_time = now
+        self._start_monotonic = time.monotonic()
         self._chunks = []
         self._audio_queue = queue.Queue()
         
@@ -218,19 +230,17 @@ class VoiceRecorder:
         if not self._chunks:
             return None
         
-        # Concatenate all chunks
-        all_audio = np.concatenate([chunk[1] for chunk in self._chunks], axis=0)
-        
         filename = f"{self._session_id}_complete.wav"
         filepath = self.output_dir / filename
         
-        audio_int16 = (all_audio * 32767).astype(np.int16)
-        
+        # Stream the stored 16-bit PCM chunks straight into the file rather
+        # than concatenating the whole session into one buffer first
         with wave.open(str(filepath), 'wb') as wf:
             wf.setnchannels(self.channels)
             wf.setsampwidth(2)
             wf.setframerate(self.sample_rate)
-            wf.writeframes(audio_int16.tobytes())
+            for _, audio_int16 in self._chunks:
+                wf.writeframes(np.ascontiguousarray(audio_int16))
         
         self.logger.info(f"Saved complete recording: {filepath}")
         return filepath